@@ -0,0 +1,296 @@
+"""
+Pure-math helpers for the cube animation: homogeneous column vectors,
+transform matrices and batched coordinate kernels.
+
+This module never imports bpy, so the hot math paths can be profiled,
+benchmarked and (when numba is installed) JIT-compiled under a regular
+Python interpreter, without spawning Blender.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the batch kernels fall back to numpy.
+    njit = None
+
+npa = np.ndarray
+
+
+def column_vector(x: float, y: float, z: float) -> npa:
+    """
+    Build a homogeneous column vector as a plain numpy array.
+
+    Args:
+        x: The x coordinate.
+        y: The y coordinate.
+        z: The z coordinate.
+
+    Returns:
+        vector: The (4,) homogeneous vector [x, y, z, 1].
+    """
+    return np.array([x, y, z, 1.0], dtype=np.float64)
+
+
+# Scratch matrices reused by the vector-dependent builders (which cannot
+# be lru_cache'd on an array argument). Each builder rewrites exactly the
+# cells it owns, so the hot path allocates nothing; the returned matrix
+# is only valid until the builder's next call.
+_TRANSLATION_M = np.identity(4)
+_SCALING_M = np.identity(4)
+
+
+def translation_matrix(c_vector) -> npa:
+    """
+    Build the 4x4 homogeneous translation matrix for a vector.
+
+    Args:
+        c_vector: The vector to translate by (only the first three components are read).
+
+    Returns:
+        matrix: The 4x4 translation matrix (shared scratch, do not keep).
+    """
+    matrix = _TRANSLATION_M
+    matrix[0][3] = c_vector[0]
+    matrix[1][3] = c_vector[1]
+    matrix[2][3] = c_vector[2]
+
+    return matrix
+
+
+def scaling_matrix(c_vector) -> npa:
+    """
+    Build the 4x4 homogeneous scaling matrix for a vector.
+
+    Args:
+        c_vector: The vector to scale by (only the first three components are read).
+
+    Returns:
+        matrix: The 4x4 scaling matrix (shared scratch, do not keep).
+    """
+    matrix = _SCALING_M
+    matrix[0][0] = c_vector[0]
+    matrix[1][1] = c_vector[1]
+    matrix[2][2] = c_vector[2]
+
+    return matrix
+
+
+@lru_cache(maxsize=None)
+def rotation_x_matrix(angle: float) -> npa:
+    """
+    Build the 4x4 homogeneous rotation matrix around the x-axis.
+
+    The matrix is cached per angle, so animation loops applying the same
+    incremental rotation build it only once; callers must not mutate it.
+
+    Args:
+        angle: The angle to rotate by in degrees.
+
+    Returns:
+        matrix: The 4x4 rotation matrix.
+    """
+    angle = math.radians(angle)
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    matrix = np.identity(4)
+    matrix[1][1] = cos
+    matrix[1][2] = -sin
+    matrix[2][1] = sin
+    matrix[2][2] = cos
+
+    return matrix
+
+
+@lru_cache(maxsize=None)
+def rotation_y_matrix(angle: float) -> npa:
+    """
+    Build the 4x4 homogeneous rotation matrix around the y-axis.
+
+    The matrix is cached per angle, so animation loops applying the same
+    incremental rotation build it only once; callers must not mutate it.
+
+    Args:
+        angle: The angle to rotate by in degrees.
+
+    Returns:
+        matrix: The 4x4 rotation matrix.
+    """
+    angle = math.radians(angle)
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    matrix = np.identity(4)
+    matrix[0][0] = cos
+    matrix[0][2] = sin
+    matrix[2][0] = -sin
+    matrix[2][2] = cos
+
+    return matrix
+
+
+@lru_cache(maxsize=None)
+def rotation_z_matrix(angle: float) -> npa:
+    """
+    Build the 4x4 homogeneous rotation matrix around the z-axis.
+
+    The matrix is cached per angle, so animation loops applying the same
+    incremental rotation build it only once; callers must not mutate it.
+
+    Args:
+        angle: The angle to rotate by in degrees.
+
+    Returns:
+        matrix: The 4x4 rotation matrix.
+    """
+    angle = math.radians(angle)
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    matrix = np.identity(4)
+    matrix[0][0] = cos
+    matrix[0][1] = -sin
+    matrix[1][0] = sin
+    matrix[1][1] = cos
+
+    return matrix
+
+
+# Output scratch shared by the batched transforms: matmul cannot write
+# over its own input, and routing the result through a reused buffer
+# keeps long animations free of one temporary allocation per call.
+_BATCH_OUT = np.empty((8, 4))
+
+
+def _batch_out(length: int) -> npa:
+    """
+    Return a (length, 4) contiguous scratch buffer, grown on demand.
+
+    Args:
+        length: The number of rows needed.
+
+    Returns:
+        buffer: The scratch buffer (shared, valid until the next call).
+    """
+    global _BATCH_OUT
+
+    if _BATCH_OUT.shape[0] < length:
+        _BATCH_OUT = np.empty((length, 4))
+
+    return _BATCH_OUT[:length]
+
+
+def translate(coords: npa, c_vector) -> None:
+    """
+    Translate every point of a (N, 4) coordinates array in place.
+
+    Args:
+        coords: The (N, 4) homogeneous coordinates array.
+        c_vector: The vector to translate the points by.
+
+    Returns:
+        None
+    """
+    out = _batch_out(len(coords))
+    np.dot(coords, translation_matrix(c_vector).T, out=out)
+    coords[:] = out
+
+
+def _rotate_z_kernel(coords: npa, angle: float) -> None:
+    """
+    Rotate every row of a (N, 4) coordinates array around the z-axis in place.
+
+    Written with scalar math per row so that numba, when available,
+    compiles it down to a tight loop with zero Python dispatch; it is
+    only used once compiled, the interpreted fallback being the numpy
+    matmul in rotate_z().
+
+    Args:
+        coords: The (N, 4) homogeneous coordinates array.
+        angle: The angle to rotate the points by in radians.
+
+    Returns:
+        None
+    """
+    cos, sin = math.cos(angle), math.sin(angle)
+
+    for i in range(coords.shape[0]):
+        x, y = coords[i, 0], coords[i, 1]
+        coords[i, 0] = cos * x - sin * y
+        coords[i, 1] = sin * x + cos * y
+
+
+if njit is not None:
+    _rotate_z_kernel = njit(cache=True, fastmath=True)(_rotate_z_kernel)
+
+
+def rotate_z(coords: npa, angle: float) -> None:
+    """
+    Rotate every point of a (N, 4) coordinates array around the z-axis in place.
+
+    Args:
+        coords: The (N, 4) homogeneous coordinates array.
+        angle: The angle to rotate the points by in degrees.
+
+    Returns:
+        None
+    """
+    if njit is not None:
+        _rotate_z_kernel(coords, math.radians(angle))
+    else:
+        out = _batch_out(len(coords))
+        np.dot(coords, rotation_z_matrix(angle).T, out=out)
+        coords[:] = out
+
+
+def _simulate_z_rotation_kernel(base_xyz: npa, n_frames: int, dtheta: float) -> npa:
+    """
+    Step a z-rotation frame by frame, returning every intermediate state.
+
+    Sequential kernel for animations that have no closed form (the cube's
+    own rotation uses the einsum path in compute_trajectory instead).
+    With numba available the double loop compiles to tight machine code;
+    scalar math only, so nothing blocks the njit pipeline.
+
+    Args:
+        base_xyz: The (N, 3) starting positions.
+        n_frames: The number of animation frames to step through.
+        dtheta: The per-frame rotation angle in radians.
+
+    Returns:
+        states: The (n_frames + 1, N, 3) positions per frame.
+    """
+    n_points = base_xyz.shape[0]
+    states = np.empty((n_frames + 1, n_points, 3))
+    states[0] = base_xyz
+
+    cos, sin = math.cos(dtheta), math.sin(dtheta)
+
+    for frame in range(1, n_frames + 1):
+        for point in range(n_points):
+            x, y = states[frame - 1, point, 0], states[frame - 1, point, 1]
+            states[frame, point, 0] = cos * x - sin * y
+            states[frame, point, 1] = sin * x + cos * y
+            states[frame, point, 2] = states[frame - 1, point, 2]
+
+    return states
+
+
+if njit is not None:
+    _simulate_z_rotation_kernel = njit(cache=True, fastmath=True)(_simulate_z_rotation_kernel)
+
+
+def simulate_z_rotation(base_xyz: npa, n_frames: int, dtheta_deg: float) -> npa:
+    """
+    Simulate an incremental z-rotation over a number of frames.
+
+    Args:
+        base_xyz: The (N, 3) starting positions.
+        n_frames: The number of animation frames to step through.
+        dtheta_deg: The per-frame rotation angle in degrees.
+
+    Returns:
+        states: The (n_frames + 1, N, 3) positions per frame.
+    """
+    return _simulate_z_rotation_kernel(base_xyz, n_frames, math.radians(dtheta_deg))